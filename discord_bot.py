@@ -26,23 +26,36 @@ Required Discord Developer Portal Settings:
 import discord
 from discord.ext import commands, tasks
 import asyncio
+import contextlib
 import json
 import os
-from datetime import datetime
-from typing import Optional, Dict, Set
+import random
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from discord.utils import utcnow
+from typing import Optional, Dict, Set, Tuple
 import logging
 from dotenv import load_dotenv
 
+# Prefer orjson (C implementation) for settings I/O, fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging with UTF-8 encoding
 import sys
+_file_handler = logging.FileHandler('bot.log', encoding='utf-8')
+_file_handler.setLevel(logging.WARNING)  # Keep the log file quiet by default
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('bot.log', encoding='utf-8'),
+        _file_handler,
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -52,9 +65,255 @@ logger = logging.getLogger(__name__)
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8')
 
+# Use uvloop's libuv-backed event loop where available (not supported on Windows)
+if sys.platform != "win32":
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("uvloop event loop policy installed")
+    except ImportError:
+        pass
+
 # Bot configuration
 SETTINGS_FILE = 'bot_settings.json'
 UPDATE_INTERVAL_MINUTES = 5
+DM_CONCURRENCY = 10  # Max DMs in flight at once
+DM_RATE = 45  # Self-imposed DM budget: at most DM_RATE sends per DM_RATE_PERIOD seconds
+DM_RATE_PERIOD = 10.0
+SUMMARY_CONCURRENCY = 5  # Max periodic summary sends in flight at once
+STATUS_DEDUPE_SECONDS = 30  # Coalesce duplicate online transitions within this window
+SAVE_DEBOUNCE_SECONDS = 2  # Coalesce bursts of settings saves into one disk write
+ONLINE_CACHE_SECONDS = 1.0  # How long a computed online-member list stays fresh
+
+# ansi code-block banners used in embed descriptions, hoisted out of the handlers
+_BANNER_LIVE = "```ansi\n\u001b[1;32m\u2593\u2593\u2593 LIVE SERVER STATUS \u2593\u2593\u2593\u001b[0m\n```\n"
+_BANNER_SNAPSHOT = "```ansi\n\u001b[1;36m\u2593\u2593\u2593 INSTANT SERVER SNAPSHOT \u2593\u2593\u2593\u001b[0m\n```\n"
+_BANNER_OPERATIONAL = "```ansi\n\u001b[1;32m\u2593\u2593\u2593 SYSTEM STATUS: OPERATIONAL \u2593\u2593\u2593\u001b[0m\n```\n"
+
+# Statuses treated as "not online", hoisted so hot loops skip attribute lookups
+_OFFLINE_STATUSES = frozenset({discord.Status.offline, discord.Status.invisible})
+
+# Display order for status sections in summary embeds
+_TRACKED_STATUSES = (discord.Status.online, discord.Status.idle, discord.Status.dnd)
+
+# Per-status presentation tables, built once at import instead of per call
+_SUMMARY_STATUS_INFO = {
+    discord.Status.online: {
+        "emoji": "🟢",
+        "name": "🌟 Online & Active",
+        "description": "```diff\n+ Ready to chat and engage!\n```",
+        "animation": "⚡"
+    },
+    discord.Status.idle: {
+        "emoji": "🟡",
+        "name": "🌙 Away",
+        "description": "```yaml\n~ Might be busy or AFK\n```",
+        "animation": "💤"
+    },
+    discord.Status.dnd: {
+        "emoji": "🔴",
+        "name": "🚫 Do Not Disturb",
+        "description": "```css\n/* Please respect their focus time */\n```",
+        "animation": "🔕"
+    }
+}
+_STATUS_INFO = {
+    discord.Status.online: {
+        "emoji": "🟢",
+        "name": "🌟 Online & Ready",
+        "description": "```diff\n+ Active and ready to engage!\n```",
+        "animation": "⚡",
+        "subtitle": "Perfect for chatting!"
+    },
+    discord.Status.idle: {
+        "emoji": "🟡",
+        "name": "🌙 Away Mode",
+        "description": "```yaml\n~ Might be multitasking or AFK\n```",
+        "animation": "💤",
+        "subtitle": "May respond slower"
+    },
+    discord.Status.dnd: {
+        "emoji": "🔴",
+        "name": "🚫 Focus Mode",
+        "description": "```css\n/* Deep work or important tasks */\n```",
+        "animation": "🔕",
+        "subtitle": "Please be respectful"
+    }
+}
+
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter so we pace ourselves below Discord's 429 threshold"""
+
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it"""
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.per)
+            self.updated = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) * self.per / self.rate)
+                self.updated = time.monotonic()
+                self.tokens = 0.0
+            else:
+                self.tokens -= 1
+
+
+class _LazyRoles:
+    """Defers joining a member's role names until a log record is actually formatted"""
+    __slots__ = ('member',)
+
+    def __init__(self, member: discord.Member):
+        self.member = member
+
+    def __str__(self) -> str:
+        return ', '.join(role.name for role in self.member.roles)
+
+# All 11 possible activity progress bars, built once instead of per send
+_PROGRESS_BARS = tuple("🟩" * i + "⬜" * (10 - i) for i in range(11))
+
+# Threshold tables for the vibe/activity ladders, indexed via bisect
+_VIBE_THRESHOLDS = (10, 25, 50, 75)
+_VIBE_EMOJIS = ("😴", "🌱", "🔥", "⚡", "🌟")
+_VIBE_TEXTS = ("Peaceful & Quiet", "Growing Energy", "Active & Lively",
+               "High Energy Zone", "LEGENDARY ACTIVITY!")
+_COUNT_THRESHOLDS = (1, 3, 8, 15)
+_ACTIVITY_MESSAGES = (
+    "A brave soul ventures into the digital realm!",
+    "A cozy gathering of digital friends!",
+    "The conversation is heating up!",
+    "This server is absolutely buzzing with energy!",
+    "MAXIMUM SOCIAL ENERGY ACHIEVED! 🚀",
+)
+# Title/color pairs for the /online embed, indexed via bisect on _COUNT_THRESHOLDS
+_TITLE_COLOR_TABLE = (
+    ("👑✨ A Lone Digital Warrior!", discord.Color.from_rgb(87, 242, 135)),   # Light green
+    ("🎭🎪 Intimate Gathering Mode!", discord.Color.from_rgb(87, 242, 135)),  # Light green
+    ("🎉🔥 Party Time Activated!", discord.Color.from_rgb(255, 231, 146)),    # Yellow
+    ("🚀⚡ HIGH ENERGY DETECTED!", discord.Color.from_rgb(255, 159, 67)),     # Orange
+    ("🌟💫 LEGENDARY ACTIVITY LEVEL!", discord.Color.from_rgb(255, 107, 107)),  # Red
+)
+_ENGAGEMENT_SUGGESTIONS = (
+    "Perfect time to share something interesting and draw others in!",
+    "Great for intimate discussions or planning something fun!",
+    "Ideal for group activities, games, or collaborative projects!",
+    "Amazing energy for events, contests, or community activities!",
+    "MAXIMUM POTENTIAL! Host events, start discussions, go wild!",
+)
+
+
+def _get_activity_message(count: int) -> str:
+    """Get dynamic activity message based on member count"""
+    return _ACTIVITY_MESSAGES[bisect_left(_COUNT_THRESHOLDS, count)]
+
+
+def _get_vibe_emoji(percentage: float) -> str:
+    """Get vibe emoji based on activity percentage"""
+    return _VIBE_EMOJIS[bisect_right(_VIBE_THRESHOLDS, percentage)]
+
+
+def _get_vibe_text(percentage: float) -> str:
+    """Get vibe text based on activity percentage"""
+    return _VIBE_TEXTS[bisect_right(_VIBE_THRESHOLDS, percentage)]
+
+
+def _get_engagement_suggestion(count: int) -> str:
+    """Get engagement suggestions based on online member count"""
+    return _ENGAGEMENT_SUGGESTIONS[bisect_left(_COUNT_THRESHOLDS, count)]
+
+# Fun facts that never change, baked once at import
+_STATIC_FACTS = (
+    "Fun fact: The perfect group size for discussions is 3-8 people!",
+    "Pro tip: The best conversations happen when people are genuinely engaged!",
+    "Cool fact: Online communities create bonds that last a lifetime!",
+    "Did you know? Active servers create the strongest friendships!",
+)
+# Facts that interpolate the online count, formatted only when picked
+_DYNAMIC_FACTS = (
+    "With {count} people online, you could start a great conversation!",
+    "Did you know? {count} online members = infinite possibilities!",
+    "Amazing! {count} digital souls are sharing this moment together!",
+    "Interesting: {count} people online means {count} unique perspectives!",
+)
+
+
+_RED = discord.Color.red()  # Color.red() allocates a fresh object per call
+
+
+def _error_embed(description: str, title: str = "❌ Error") -> discord.Embed:
+    """Build a red error embed using the cached color"""
+    return discord.Embed(title=title, description=description, color=_RED)
+
+
+def _not_found_embed(what: str, description: str) -> discord.Embed:
+    """Build a red "missing configuration" embed (no role/channel set, etc.)"""
+    return _error_embed(description, title=f"❌ {what}")
+
+
+def _require_admin(interaction: discord.Interaction) -> Optional[discord.Embed]:
+    """Return a Permission Denied embed if the caller lacks Manage Roles, else None"""
+    if interaction.user.guild_permissions.manage_roles:
+        return None
+    return _error_embed(
+        "You need the 'Manage Roles' permission to use this command.",
+        title="❌ Permission Denied"
+    )
+
+
+def _build_empty_online_template() -> discord.Embed:
+    """Build the static skeleton of the /online 'nobody online' embed"""
+    embed = discord.Embed(
+        title="🌙✨ The Digital Realm is Quiet...",
+        description="```yaml\n🌟 Nobody's online right now 🌟\n```\n"
+                    "💤 **0** members currently active\n\n"
+                    "🔮 *Perfect time to be the first one to start the conversation!*",
+        color=discord.Color.from_rgb(47, 49, 54)
+    )
+    embed.add_field(
+        name="🎯 Quick Actions",
+        value="```css\n• Send a message to wake everyone up!\n• Check back in a few minutes\n• Start an interesting topic\n```",
+        inline=True
+    )
+    embed.add_field(
+        name="⏰ Best Times",
+        value="```ini\n[Peak Hours] = Usually evenings\n[Weekends]   = More activity\n[Events]     = Check announcements\n```",
+        inline=True
+    )
+    embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/787038339664781322.png")
+    return embed
+
+
+_EMPTY_ONLINE_TEMPLATE = _build_empty_online_template()
+
+
+def _build_empty_summary_template() -> discord.Embed:
+    """Build the static skeleton of the 'nobody online' summary embed"""
+    embed = discord.Embed(
+        title="🌙✨ The Server is Sleeping...",
+        description="```\n🌟 Nobody's online right now 🌟\n```\n"
+                    "💤 **0** members currently active\n\n"
+                    "🔮 *The digital realm awaits your return...*",
+        color=discord.Color.from_rgb(47, 49, 54)
+    )
+    embed.add_field(
+        name="⏰ Auto-Updates",
+        value="```yaml\nNext check: 5 minutes\nStatus: Active 🟢\n```",
+        inline=True
+    )
+    embed.add_field(
+        name="💡 Pro Tip",
+        value="```css\n/* Be the first to wake up the server! */\n```",
+        inline=True
+    )
+    embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/787038339664781322.png")
+    return embed
 
 class OnlineMemberTracker(commands.Bot):
     def __init__(self):
@@ -62,11 +321,15 @@ class OnlineMemberTracker(commands.Bot):
         intents = discord.Intents.default()
         intents.members = True  # Required to access member list
         intents.presences = True  # Required to track online status
-        intents.message_content = True  # For potential prefix commands
-        
+        # message_content intent intentionally left off: the bot only uses
+        # slash commands, and streaming every message body wastes gateway
+        # bandwidth and deserialization CPU on busy guilds
+
         super().__init__(
-            command_prefix='!',  # Fallback prefix
+            command_prefix=commands.when_mentioned,  # No prefix commands; avoids needing message content
             intents=intents,
+            # No voice features; keep fewer member objects resident
+            member_cache_flags=discord.MemberCacheFlags(joined=True, voice=False),
             help_command=None
         )
         
@@ -74,8 +337,22 @@ class OnlineMemberTracker(commands.Bot):
         self.notification_channels: Dict[int, int] = {}
         # Store target roles per guild for notifications
         self.target_roles: Dict[int, int] = {}
-        # Track previous online members for change detection
-        self.previous_online: Dict[int, Set[int]] = {}
+        # Cached member ids holding the target role per guild (O(1) presence checks)
+        self.target_role_members: Dict[int, Set[int]] = {}
+        # Recent online transitions, keyed by (guild_id, member_id), for dedupe
+        self._recent_online: Dict[Tuple[int, int], float] = {}
+        # Debounced settings writer state
+        self._save_pending = False
+        self._save_task: Optional[asyncio.Task] = None
+        # Short-lived cache of online-member lists per guild
+        self._online_cache: Dict[int, Tuple[float, list]] = {}
+        # Static embed skeleton, cloned per send instead of rebuilt
+        self._empty_summary_template = _build_empty_summary_template()
+        # Pace DM sends below Discord's published cap to avoid 429 back-off stalls
+        self._dm_bucket = AsyncTokenBucket(DM_RATE, DM_RATE_PERIOD)
+        # Per-guild caches for icon URLs and target role objects, busted on guild/role events
+        self._icon_url_cache: Dict[int, Optional[str]] = {}
+        self._target_role_cache: Dict[int, discord.Role] = {}
         
         # Load settings
         self.load_settings()
@@ -84,35 +361,100 @@ class OnlineMemberTracker(commands.Bot):
         """Load bot settings from file"""
         try:
             if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, 'r') as f:
-                    data = json.load(f)
+                with open(SETTINGS_FILE, 'rb') as f:
+                    raw = f.read()
+                    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                     self.notification_channels = {int(k): v for k, v in data.get('notification_channels', {}).items()}
                     self.target_roles = {int(k): v for k, v in data.get('target_roles', {}).items()}
                     logger.info(f"Loaded settings for {len(self.notification_channels)} guilds")
         except Exception as e:
             logger.error(f"Error loading settings: {e}")
     
-    def save_settings(self):
-        """Save bot settings to file"""
-        try:
-            data = {
-                'notification_channels': self.notification_channels,
-                'target_roles': self.target_roles
-            }
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
-            logger.info("Settings saved successfully")
-        except Exception as e:
-            logger.error(f"Error saving settings: {e}")
+    async def save_settings(self):
+        """Schedule a settings save, coalescing bursts into one write"""
+        self._save_pending = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._settings_writer())
+
+    def _encode_settings(self) -> bytes:
+        """Serialize the current settings payload"""
+        data = {
+            'notification_channels': self.notification_channels,
+            'target_roles': self.target_roles
+        }
+        if orjson is not None:
+            # Settings dicts are keyed by int guild ids; orjson rejects those
+            # without OPT_NON_STR_KEYS (stdlib json stringifies them silently)
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data).encode('utf-8')
+
+    async def _settings_writer(self):
+        """Write settings off the event loop, debouncing repeated requests"""
+        while self._save_pending:
+            self._save_pending = False
+            try:
+                payload = self._encode_settings()
+                await asyncio.to_thread(self._write_atomic, payload)
+                logger.info("Settings saved successfully")
+            except Exception as e:
+                logger.error(f"Error saving settings: {e}")
+            await asyncio.sleep(SAVE_DEBOUNCE_SECONDS)
+
+    def _write_atomic(self, payload: bytes):
+        """Write payload to a temp file, then atomically replace the settings file"""
+        tmp_path = SETTINGS_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, SETTINGS_FILE)
+
+    async def close(self):
+        """Flush any debounced settings write before disconnecting"""
+        if self._save_task is not None and not self._save_task.done():
+            self._save_task.cancel()
+            # Cancelling doesn't stop a write already running in a worker
+            # thread; wait it out so the flush below can't race it on the
+            # same tmp file
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._save_task
+            self._save_pending = True
+        if self._save_pending:
+            self._save_pending = False
+            try:
+                self._write_atomic(self._encode_settings())
+                logger.info("Settings flushed on shutdown")
+            except Exception as e:
+                logger.error(f"Error flushing settings on shutdown: {e}")
+        await super().close()
     
+    def _guild_icon_url(self, guild: discord.Guild) -> Optional[str]:
+        """Cached guild icon URL; Asset construction isn't free on hot paths"""
+        guild_id = guild.id
+        if guild_id not in self._icon_url_cache:
+            self._icon_url_cache[guild_id] = guild.icon.url if guild.icon else None
+        return self._icon_url_cache[guild_id]
+
+    def _get_target_role(self, guild: discord.Guild) -> Optional[discord.Role]:
+        """Cached target role object for a guild, resolved lazily"""
+        role = self._target_role_cache.get(guild.id)
+        if role is None:
+            role_id = self.target_roles.get(guild.id)
+            if role_id is None:
+                return None
+            role = guild.get_role(role_id)
+            if role is not None:
+                self._target_role_cache[guild.id] = role
+        return role
+
     def get_online_members(self, guild: discord.Guild) -> list:
-        """Get list of online non-bot members"""
-        online_members = []
-        for member in guild.members:
-            if (not member.bot and 
-                member.status != discord.Status.offline and 
-                member.status != discord.Status.invisible):
-                online_members.append(member)
+        """Get list of online non-bot members (cached briefly to absorb bursts)"""
+        now = time.monotonic()
+        cached = self._online_cache.get(guild.id)
+        if cached is not None and now - cached[0] < ONLINE_CACHE_SECONDS:
+            return cached[1]
+
+        offline = _OFFLINE_STATUSES
+        online_members = [m for m in guild.members if not m.bot and m.status not in offline]
+        self._online_cache[guild.id] = (now, online_members)
         return online_members
     
     async def send_online_summary(self, channel: discord.TextChannel, guild: discord.Guild):
@@ -121,37 +463,15 @@ class OnlineMemberTracker(commands.Bot):
             online_members = self.get_online_members(guild)
             
             if not online_members:
-                embed = discord.Embed(
-                    title="🌙✨ The Server is Sleeping...",
-                    description="```\n🌟 Nobody's online right now 🌟\n```\n" +
-                               "💤 **0** members currently active\n\n" +
-                               "🔮 *The digital realm awaits your return...*",
-                    color=discord.Color.from_rgb(47, 49, 54),
-                    timestamp=datetime.now()
-                )
-                embed.add_field(
-                    name="⏰ Auto-Updates",
-                    value="```yaml\nNext check: 5 minutes\nStatus: Active 🟢\n```",
-                    inline=True
-                )
-                embed.add_field(
-                    name="💡 Pro Tip",
-                    value="```css\n/* Be the first to wake up the server! */\n```",
-                    inline=True
-                )
-                embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/787038339664781322.png")
+                # Clone the prebuilt skeleton; only the timestamp is dynamic
+                embed = self._empty_summary_template.copy()
+                embed.timestamp = utcnow()
             else:
-                # Group members by status
-                status_groups = {
-                    discord.Status.online: [],
-                    discord.Status.idle: [],
-                    discord.Status.dnd: []
-                }
-                
+                # Group members by status in a single pass
+                status_groups = defaultdict(list)
                 for member in online_members:
-                    if member.status in status_groups:
-                        status_groups[member.status].append(member)
-                
+                    status_groups[member.status].append(member)
+
                 # Create animated title based on member count
                 if len(online_members) == 1:
                     title = "👋✨ A Lone Warrior Appears!"
@@ -175,68 +495,52 @@ class OnlineMemberTracker(commands.Bot):
                     color = discord.Color.from_rgb(255, 107, 107)  # Red
                 
                 # Create progress bar for activity level
-                total_members = len(guild.members)
+                total_members = guild.member_count or len(guild.members)
                 online_percentage = (len(online_members) / total_members) * 100
                 progress_bars = int(online_percentage / 10)
-                progress_bar = "🟩" * progress_bars + "⬜" * (10 - progress_bars)
+                progress_bar = _PROGRESS_BARS[min(progress_bars, 10)]
                 
                 embed = discord.Embed(
                     title=title,
-                    description=f"```ansi\n\u001b[1;32m▓▓▓ LIVE SERVER STATUS ▓▓▓\u001b[0m\n```\n" +
-                               f"🎯 **{len(online_members)}** members online and ready!\n" +
-                               f"📊 Activity Level: {progress_bar} **{online_percentage:.1f}%**\n\n" +
-                               f"💬 *{self._get_activity_message(len(online_members))}*",
+                    description=_BANNER_LIVE +
+                                f"🎯 **{len(online_members)}** members online and ready!\n"
+                                f"📊 Activity Level: {progress_bar} **{online_percentage:.1f}%**\n\n"
+                                f"💬 *{_get_activity_message(len(online_members))}*",
                     color=color,
-                    timestamp=datetime.now()
+                    timestamp=utcnow()
                 )
                 
-                # Enhanced status info with animations
-                status_info = {
-                    discord.Status.online: {
-                        "emoji": "🟢",
-                        "name": "🌟 Online & Active",
-                        "description": "```diff\n+ Ready to chat and engage!\n```",
-                        "animation": "⚡"
-                    },
-                    discord.Status.idle: {
-                        "emoji": "🟡", 
-                        "name": "🌙 Away",
-                        "description": "```yaml\n~ Might be busy or AFK\n```",
-                        "animation": "💤"
-                    },
-                    discord.Status.dnd: {
-                        "emoji": "🔴",
-                        "name": "🚫 Do Not Disturb",
-                        "description": "```css\n/* Please respect their focus time */\n```",
-                        "animation": "🔕"
-                    }
-                }
-                
-                # Add beautiful status fields
-                for status, members in status_groups.items():
+                # Enhanced status info with animations (module-level constant)
+                status_info = _SUMMARY_STATUS_INFO
+
+
+                # Add beautiful status fields in a fixed display order
+                inline_fields = sum(1 for s in _TRACKED_STATUSES if status_groups.get(s)) > 1
+                for status in _TRACKED_STATUSES:
+                    members = status_groups.get(status)
                     if members:
                         status_data = status_info[status]
-                        
-                        # Create animated member list
-                        if len(members) <= 6:
-                            member_list = "\n".join([f"{status_data['animation']} **{member.display_name}**" for member in members])
-                        else:
-                            member_list = "\n".join([f"{status_data['animation']} **{member.display_name}**" for member in members[:6]])
+
+                        # Create animated member list (slice first, join a generator)
+                        anim = status_data['animation']
+                        shown = members[:6]
+                        member_list = "\n".join(f"{anim} **{m.display_name}**" for m in shown)
+                        if len(members) > 6:
                             member_list += f"\n🎭 *...and {len(members) - 6} more amazing people!*"
-                        
+
                         embed.add_field(
                             name=f"{status_data['emoji']} {status_data['name']} ({len(members)})",
                             value=f"{status_data['description']}\n{member_list}",
-                            inline=True if len([g for g in status_groups.values() if g]) > 1 else False
+                            inline=inline_fields
                         )
                 
                 # Enhanced activity summary with visual elements
                 embed.add_field(
                     name="📈🎯 Server Pulse",
-                    value=f"```ini\n[Activity Level] = {online_percentage:.1f}%\n" +
-                          f"[Online Now]    = {len(online_members)} members\n" +
-                          f"[Total Members] = {total_members} people\n```\n" +
-                          f"🎪 **Community Vibe:** {self._get_vibe_emoji(online_percentage)} {self._get_vibe_text(online_percentage)}",
+                    value=f"```ini\n[Activity Level] = {online_percentage:.1f}%\n"
+                          f"[Online Now]    = {len(online_members)} members\n"
+                          f"[Total Members] = {total_members} people\n```\n"
+                          f"🎪 **Community Vibe:** {_get_vibe_emoji(online_percentage)} {_get_vibe_text(online_percentage)}",
                     inline=False
                 )
                 
@@ -249,7 +553,7 @@ class OnlineMemberTracker(commands.Bot):
             
             embed.set_footer(
                 text=f"🏰 {guild.name} • 🔄 Auto-refresh every 5min",
-                icon_url=guild.icon.url if guild.icon else None
+                icon_url=self._guild_icon_url(guild)
             )
             
             await channel.send(embed=embed)
@@ -264,11 +568,13 @@ class OnlineMemberTracker(commands.Bot):
         try:
             logger.info(f"Sending DM notifications for {member.display_name} coming online")
             
-            # Get all members with the target role (excluding the member who just came online)
-            members_to_notify = [m for m in target_role.members if m != member and not m.bot]
+            # Get all members with the target role (excluding the member who just came online).
+            # Compare raw ids instead of going through Member.__eq__ per element.
+            member_id = member.id
+            members_to_notify = [m for m in target_role.members if m.id != member_id and not m.bot]
             
             if not members_to_notify:
-                logger.info(f"No members to notify for {member.display_name} coming online")
+                logger.debug("No members to notify for %s coming online", member.display_name)
                 return
             
             # Create the DM embed
@@ -276,7 +582,7 @@ class OnlineMemberTracker(commands.Bot):
                 title="🟢 Someone's Online!",
                 description=f"**{member.display_name}** just came online in **{member.guild.name}**!",
                 color=0x00ff00,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             )
             embed.set_thumbnail(url=member.display_avatar.url)
             embed.add_field(
@@ -286,99 +592,44 @@ class OnlineMemberTracker(commands.Bot):
             )
             embed.set_footer(
                 text=f"From {member.guild.name}",
-                icon_url=member.guild.icon.url if member.guild.icon else None
+                icon_url=self._guild_icon_url(member.guild)
             )
             
-            # Send DMs to all members with the target role
-            successful_dms = 0
-            failed_dms = 0
-            
-            for notify_member in members_to_notify:
-                try:
-                    await notify_member.send(embed=embed)
-                    successful_dms += 1
-                    logger.info(f"✅ DM sent to {notify_member.display_name}")
-                except discord.Forbidden:
-                    failed_dms += 1
-                    logger.warning(f"❌ Cannot send DM to {notify_member.display_name} (DMs disabled)")
-                except discord.HTTPException as e:
-                    failed_dms += 1
-                    logger.error(f"❌ Failed to send DM to {notify_member.display_name}: {e}")
-                except Exception as e:
-                    failed_dms += 1
-                    logger.error(f"❌ Unexpected error sending DM to {notify_member.display_name}: {e}")
-            
+            # Send DMs concurrently, capped so we stay within Discord's per-route bucket
+            sem = asyncio.Semaphore(DM_CONCURRENCY)
+
+            async def send_one_dm(notify_member: discord.Member) -> bool:
+                async with sem:
+                    try:
+                        await self._dm_bucket.acquire()
+                        await notify_member.send(embed=embed)
+                        logger.debug("✅ DM sent to %s", notify_member.display_name)
+                        return True
+                    except discord.Forbidden:
+                        logger.warning(f"❌ Cannot send DM to {notify_member.display_name} (DMs disabled)")
+                        return False
+                    except discord.HTTPException as e:
+                        logger.error(f"❌ Failed to send DM to {notify_member.display_name}: {e}")
+                        return False
+                    except Exception as e:
+                        logger.error(f"❌ Unexpected error sending DM to {notify_member.display_name}: {e}")
+                        return False
+
+            results = await asyncio.gather(*[send_one_dm(m) for m in members_to_notify])
+            successful_dms = sum(results)
+            failed_dms = len(results) - successful_dms
+
             logger.info(f"DM notification summary: {successful_dms} sent, {failed_dms} failed")
             
         except Exception as e:
             logger.error(f"Error in send_dm_notifications: {e}")
     
-    def _get_activity_message(self, count: int) -> str:
-        """Get dynamic activity message based on member count"""
-        if count == 1:
-            return "A brave soul ventures into the digital realm!"
-        elif count <= 3:
-            return "A cozy gathering of digital friends!"
-        elif count <= 8:
-            return "The conversation is heating up!"
-        elif count <= 15:
-            return "This server is absolutely buzzing with energy!"
-        else:
-            return "MAXIMUM SOCIAL ENERGY ACHIEVED! 🚀"
-    
-    def _get_vibe_emoji(self, percentage: float) -> str:
-        """Get vibe emoji based on activity percentage"""
-        if percentage < 10:
-            return "😴"
-        elif percentage < 25:
-            return "🌱"
-        elif percentage < 50:
-            return "🔥"
-        elif percentage < 75:
-            return "⚡"
-        else:
-            return "🌟"
-    
-    def _get_vibe_text(self, percentage: float) -> str:
-        """Get vibe text based on activity percentage"""
-        if percentage < 10:
-            return "Peaceful & Quiet"
-        elif percentage < 25:
-            return "Growing Energy"
-        elif percentage < 50:
-            return "Active & Lively"
-        elif percentage < 75:
-            return "High Energy Zone"
-        else:
-            return "LEGENDARY ACTIVITY!"
-    
     def _get_fun_fact(self, count: int) -> str:
         """Get a fun fact based on online member count"""
-        facts = [
-            f"With {count} people online, you could start a great conversation!",
-            f"Did you know? {count} online members = infinite possibilities!",
-            f"Fun fact: The perfect group size for discussions is 3-8 people!",
-            f"Amazing! {count} digital souls are sharing this moment together!",
-            f"Pro tip: The best conversations happen when people are genuinely engaged!",
-            f"Cool fact: Online communities create bonds that last a lifetime!",
-            f"Interesting: {count} people online means {count} unique perspectives!",
-            f"Did you know? Active servers create the strongest friendships!"
-        ]
-        import random
-        return random.choice(facts)
-    
-    def _get_engagement_suggestion(self, count: int) -> str:
-        """Get engagement suggestions based on online member count"""
-        if count == 1:
-            return "Perfect time to share something interesting and draw others in!"
-        elif count <= 3:
-            return "Great for intimate discussions or planning something fun!"
-        elif count <= 8:
-            return "Ideal for group activities, games, or collaborative projects!"
-        elif count <= 15:
-            return "Amazing energy for events, contests, or community activities!"
-        else:
-            return "MAXIMUM POTENTIAL! Host events, start discussions, go wild!"
+        i = random.randrange(len(_STATIC_FACTS) + len(_DYNAMIC_FACTS))
+        if i < len(_STATIC_FACTS):
+            return _STATIC_FACTS[i]
+        return _DYNAMIC_FACTS[i - len(_STATIC_FACTS)].format(count=count)
     
     async def on_ready(self):
         """Called when bot is ready"""
@@ -412,16 +663,17 @@ class OnlineMemberTracker(commands.Bot):
             logger.info(f"Total members: {guild.member_count}")
             logger.info(f"Cached members: {len(guild.members)}")
             
-            # Check if we can see member presence
+            # Check if we can see member presence (one pass)
             online_count = 0
             offline_count = 0
             for member in guild.members:
-                if not member.bot:
-                    if member.status != discord.Status.offline and member.status != discord.Status.invisible:
-                        online_count += 1
-                    else:
-                        offline_count += 1
-            
+                if member.bot:
+                    continue
+                if member.status not in _OFFLINE_STATUSES:
+                    online_count += 1
+                else:
+                    offline_count += 1
+
             logger.info(f"Online members visible: {online_count}")
             logger.info(f"Offline members visible: {offline_count}")
             
@@ -431,188 +683,173 @@ class OnlineMemberTracker(commands.Bot):
                 target_role = guild.get_role(target_role_id)
                 if target_role:
                     logger.info(f"Target role: {target_role.name} ({target_role.id}) - {len(target_role.members)} members")
+                    # Cache the member id set so presence handlers avoid scanning role lists
+                    self.target_role_members[guild.id] = {m.id for m in target_role.members}
                     # List first few members with target role
-                    for i, member in enumerate(target_role.members[:3]):
-                        logger.info(f"  Member {i+1}: {member.display_name} - Status: {member.status}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for i, member in enumerate(target_role.members[:3]):
+                            logger.debug("  Member %d: %s - Status: %s", i + 1, member.display_name, member.status)
                 else:
                     logger.warning(f"Target role {target_role_id} not found!")
-            
-            online_members = self.get_online_members(guild)
-            self.previous_online[guild.id] = {member.id for member in online_members}
-        
+
         # Periodic updates disabled - only role-specific real-time notifications
     
-    async def on_member_update(self, before: discord.Member, after: discord.Member):
-        """Handle member status changes for real-time notifications with beautiful embeds"""
-        logger.info(f"on_member_update triggered for {after.display_name} ({after.id}) in guild {after.guild.name}")
-        logger.info(f"Status: {before.status} -> {after.status}")
-        logger.info(f"Activity: {before.activity} -> {after.activity}")
-        logger.info(f"Roles: {[role.name for role in after.roles]}")
-        
-        # Only process status changes, not other updates
-        if before.status == after.status:
-            logger.info(f"No status change for {after.display_name}, skipping")
-            return
-        
-        # Skip bots
-        if after.bot:
-            logger.info(f"Skipping bot {after.display_name}")
-            return
-        
+    def _update_target_role_cache(self, before: discord.Member, after: discord.Member):
+        """Apply a member's role diff to the cached target-role member set"""
         guild_id = after.guild.id
-        logger.info(f"Status change detected for {after.display_name} in guild {guild_id}: {before.status} -> {after.status}")
-        logger.info(f"Member {after.display_name} roles: {[role.name for role in after.roles]}")
-        
-        # Note: No longer requiring notification channel since we use DMs
-        
-        # Check if we have a target role set for this guild
-        if guild_id not in self.target_roles:
-            logger.info(f"No target role set for guild {guild_id}")
-            return
-        
-        # Check if the member has the target role
-        target_role_id = self.target_roles[guild_id]
-        target_role = after.guild.get_role(target_role_id)
-        if not target_role:
-            logger.warning(f"Target role {target_role_id} not found in guild {guild_id}")
+        target_role_id = self.target_roles.get(guild_id)
+        if target_role_id is None:
             return
-        
-        has_target_role = target_role in after.roles
-        
-        if not has_target_role:
-            logger.info(f"{after.display_name} does not have the target role {target_role.name}")
-            logger.info(f"Member roles: {[f'{role.name} ({role.id})' for role in after.roles]}")
-            logger.info(f"Target role ID: {target_role_id}")
-            return
-        
-        logger.info(f"{after.display_name} HAS the target role {target_role.name}")
-        logger.info(f"Processing notification for {after.display_name}...")
-        
-        try:
-            
-            # Determine if member went online or offline
-            was_online = (before.status != discord.Status.offline and 
-                         before.status != discord.Status.invisible)
-            is_online = (after.status != discord.Status.offline and 
-                        after.status != discord.Status.invisible)
-            
-            if not was_online and is_online:
-                # Member came online - send DM to users with target role
-                logger.info(f"🟢 {after.display_name} came online!")
-                await self.send_dm_notifications(after, target_role)
-                
-            elif was_online and not is_online:
-                # Member went offline - just log it, don't send notification
-                logger.info(f"🔴 {after.display_name} went offline (no notification sent)")
-                
-        except discord.HTTPException as e:
-            logger.error(f"HTTP error in member update: {e}")
-        except Exception as e:
-            logger.error(f"Error in member update handler: {e}")
-    
+
+        # Indexed probes instead of materializing before/after role-id sets
+        had_role = before.get_role(target_role_id) is not None
+        has_role = after.get_role(target_role_id) is not None
+
+        if has_role and not had_role:
+            self.target_role_members.setdefault(guild_id, set()).add(after.id)
+            logger.debug("%s gained the target role", after.display_name)
+        elif had_role and not has_role:
+            self.target_role_members.get(guild_id, set()).discard(after.id)
+            logger.debug("%s lost the target role", after.display_name)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Drop cached state when the target role is deleted"""
+        if self.target_roles.get(role.guild.id) == role.id:
+            self.target_role_members.pop(role.guild.id, None)
+            self._target_role_cache.pop(role.guild.id, None)
+            logger.warning(f"Target role {role.name} deleted in {role.guild.name}")
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Refresh the cached target role object when it changes"""
+        if self.target_roles.get(after.guild.id) == after.id:
+            self._target_role_cache[after.guild.id] = after
+
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        """Invalidate per-guild caches when guild metadata (e.g. icon) changes"""
+        self._icon_url_cache.pop(after.id, None)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        """Handle member role/profile updates (status changes live in on_presence_update)"""
+        # Keep the cached target-role member set in sync with role changes
+        if before.roles != after.roles:
+            logger.debug("Roles changed for %s in %s: %s",
+                         after.display_name, after.guild.name, _LazyRoles(after))
+            self._update_target_role_cache(before, after)
+
     async def on_presence_update(self, before: discord.Member, after: discord.Member):
         """Handle presence updates (status changes) for real-time notifications"""
-        logger.info(f"PRESENCE UPDATE: {after.display_name} - Status: {before.status} -> {after.status}")
-        if before.activity != after.activity:
-            logger.info(f"  Activity: {before.activity} -> {after.activity}")
-        
         # Only process status changes, not activity changes
         if before.status == after.status:
-            logger.info(f"No status change for {after.display_name}, skipping")
             return
-        
+
         # Skip bots
         if after.bot:
-            logger.info(f"Skipping bot {after.display_name}")
             return
-        
+
+        await self._handle_status_change(before, after)
+
+    async def _handle_status_change(self, before: discord.Member, after: discord.Member):
+        """Process a status transition and send DM notifications when a member comes online"""
         guild_id = after.guild.id
-        logger.info(f"Status change detected for {after.display_name} in guild {guild_id}: {before.status} -> {after.status}")
-        
+        logger.debug("Status change detected for %s in guild %s: %s -> %s",
+                     after.display_name, guild_id, before.status, after.status)
+
         # Note: No longer requiring notification channel since we use DMs
-        
+
         # Check if we have a target role set for this guild
         if guild_id not in self.target_roles:
-            logger.info(f"No target role set for guild {guild_id}")
+            logger.debug("No target role set for guild %s", guild_id)
             return
-        
+
         # Check if the member has the target role
-        target_role_id = self.target_roles[guild_id]
-        target_role = after.guild.get_role(target_role_id)
+        target_role = self._get_target_role(after.guild)
         if not target_role:
-            logger.warning(f"Target role {target_role_id} not found in guild {guild_id}")
+            logger.warning(f"Target role {self.target_roles[guild_id]} not found in guild {guild_id}")
             return
-        
-        has_target_role = target_role in after.roles
-        
+
+        has_target_role = after.id in self.target_role_members.get(guild_id, ())
+
         if not has_target_role:
-            logger.info(f"{after.display_name} does not have the target role {target_role.name}")
-            logger.info(f"Member roles: {[f'{role.name} ({role.id})' for role in after.roles]}")
-            logger.info(f"Target role ID: {target_role_id}")
+            logger.debug("%s does not have the target role %s", after.display_name, target_role.name)
             return
-        
-        logger.info(f"{after.display_name} HAS the target role {target_role.name}")
-        logger.info(f"Processing notification for {after.display_name}...")
-        
+
+        logger.debug("%s HAS the target role %s", after.display_name, target_role.name)
+
         try:
-            
+
             # Determine if member went online or offline
-            was_online = (before.status != discord.Status.offline and 
+            was_online = (before.status != discord.Status.offline and
                          before.status != discord.Status.invisible)
-            is_online = (after.status != discord.Status.offline and 
+            is_online = (after.status != discord.Status.offline and
                         after.status != discord.Status.invisible)
-            
-            logger.info(f"Status transition: was_online={was_online}, is_online={is_online}")
-            
+
             if not was_online and is_online:
+                # Discord often emits several presence updates per transition;
+                # coalesce repeats for the same member within the dedupe window
+                key = (guild_id, after.id)
+                now = time.monotonic()
+                last = self._recent_online.get(key)
+                if last is not None and now - last < STATUS_DEDUPE_SECONDS:
+                    logger.debug("Duplicate online transition for %s, skipping", after.display_name)
+                    return
+                self._recent_online[key] = now
+
                 # Member came online - send DM to users with target role
                 logger.info(f"🟢 {after.display_name} came online!")
                 await self.send_dm_notifications(after, target_role)
-                
+
             elif was_online and not is_online:
                 # Member went offline - just log it, don't send notification
-                logger.info(f"🔴 {after.display_name} went offline (no notification sent)")
-                
+                logger.debug("🔴 %s went offline (no notification sent)", after.display_name)
+
         except Exception as e:
-            logger.error(f"Error in presence update handler: {e}")
+            logger.error(f"Error in status change handler: {e}")
     
     async def on_user_update(self, before: discord.User, after: discord.User):
         """Debug user updates"""
-        logger.info(f"USER UPDATE: {after.display_name}")
-    
+        logger.debug("USER UPDATE: %s", after.display_name)
+
     async def on_guild_join(self, guild):
         """Debug guild events"""
         logger.info(f"GUILD JOIN: {guild.name}")
-    
+
     async def on_guild_remove(self, guild):
         """Debug guild events"""
         logger.info(f"GUILD REMOVE: {guild.name}")
-    
+
     async def on_member_join(self, member):
         """Debug member events"""
-        logger.info(f"MEMBER JOIN: {member.display_name} in {member.guild.name}")
-    
+        logger.debug("MEMBER JOIN: %s in %s", member.display_name, member.guild.name)
+
     async def on_member_remove(self, member):
         """Debug member events"""
-        logger.info(f"MEMBER REMOVE: {member.display_name} from {member.guild.name}")
-    
+        logger.debug("MEMBER REMOVE: %s from %s", member.display_name, member.guild.name)
+
     async def on_raw_member_update(self, payload):
         """Debug raw member updates"""
-        logger.info(f"RAW MEMBER UPDATE: {payload}")
+        logger.debug("RAW MEMBER UPDATE: %s", payload)
     
     @tasks.loop(minutes=UPDATE_INTERVAL_MINUTES)
     async def periodic_update(self):
-        """Send periodic online member updates"""
-        for guild in self.guilds:
-            if guild.id in self.notification_channels:
+        """Send periodic online member updates to configured guilds"""
+        if not self.notification_channels:
+            return
+
+        # Fan out to configured guilds concurrently, capped to respect API budget
+        sem = asyncio.Semaphore(SUMMARY_CONCURRENCY)
+
+        async def send_one_summary(guild_id: int, channel_id: int):
+            async with sem:
                 try:
-                    channel = self.get_channel(self.notification_channels[guild.id])
-                    if channel:
+                    guild = self.get_guild(guild_id)
+                    channel = self.get_channel(channel_id)
+                    if guild and channel:
                         await self.send_online_summary(channel, guild)
-                        # Small delay to avoid rate limits
-                        await asyncio.sleep(1)
                 except Exception as e:
-                    logger.error(f"Error in periodic update for guild {guild.id}: {e}")
+                    logger.error(f"Error in periodic update for guild {guild_id}: {e}")
+
+        await asyncio.gather(*[send_one_summary(g, c)
+                               for g, c in self.notification_channels.items()])
     
     @periodic_update.before_loop
     async def before_periodic_update(self):
@@ -627,161 +864,120 @@ async def online_command(interaction: discord.Interaction):
     """Enhanced slash command to list online members with beautiful visuals"""
     try:
         await interaction.response.defer()
-        
-        online_members = bot.get_online_members(interaction.guild)
-        
+
+        # Hoist interaction property lookups (display_name and display_avatar
+        # run fallback logic / build an Asset on every access)
+        guild = interaction.guild
+        guild_name = guild.name
+        user_name = interaction.user.display_name
+        user_icon = interaction.user.display_avatar.url
+
+        online_members = bot.get_online_members(guild)
+
         if not online_members:
-            embed = discord.Embed(
-                title="🌙✨ The Digital Realm is Quiet...",
-                description="```yaml\n🌟 Nobody's online right now 🌟\n```\n" +
-                           "💤 **0** members currently active\n\n" +
-                           "🔮 *Perfect time to be the first one to start the conversation!*",
-                color=discord.Color.from_rgb(47, 49, 54),
-                timestamp=datetime.now()
-            )
-            embed.add_field(
-                name="🎯 Quick Actions",
-                value="```css\n• Send a message to wake everyone up!\n• Check back in a few minutes\n• Start an interesting topic\n```",
-                inline=True
-            )
-            embed.add_field(
-                name="⏰ Best Times",
-                value="```ini\n[Peak Hours] = Usually evenings\n[Weekends]   = More activity\n[Events]     = Check announcements\n```",
-                inline=True
+            # Fast path: clone the prebuilt skeleton and skip all the heavy formatting
+            embed = _EMPTY_ONLINE_TEMPLATE.copy()
+            embed.timestamp = utcnow()
+            embed.set_footer(
+                text=f"🎭 Requested by {user_name} • 🏰 {guild_name} • ⚡ Instant results",
+                icon_url=user_icon
             )
-            embed.set_thumbnail(url="https://cdn.discordapp.com/emojis/787038339664781322.png")
+            await interaction.followup.send(embed=embed)
+            return
         else:
-            # Group members by status
-            status_groups = {
-                discord.Status.online: [],
-                discord.Status.idle: [],
-                discord.Status.dnd: []
-            }
-            
+            # Group members by status in a single pass
+            status_groups = defaultdict(list)
             for member in online_members:
-                if member.status in status_groups:
-                    status_groups[member.status].append(member)
-            
-            # Create spectacular animated title based on count
-            if len(online_members) == 1:
-                title = "👑✨ A Lone Digital Warrior!"
-            elif len(online_members) <= 3:
-                title = "🎭🎪 Intimate Gathering Mode!"
-            elif len(online_members) <= 8:
-                title = "🎉🔥 Party Time Activated!"
-            elif len(online_members) <= 15:
-                title = "🚀⚡ HIGH ENERGY DETECTED!"
-            else:
-                title = "🌟💫 LEGENDARY ACTIVITY LEVEL!"
-            
-            # Dynamic color scheme based on activity
-            if len(online_members) <= 3:
-                color = discord.Color.from_rgb(87, 242, 135)  # Light green
-            elif len(online_members) <= 8:
-                color = discord.Color.from_rgb(255, 231, 146)  # Yellow
-            elif len(online_members) <= 15:
-                color = discord.Color.from_rgb(255, 159, 67)   # Orange
-            else:
-                color = discord.Color.from_rgb(255, 107, 107)  # Red
+                status_groups[member.status].append(member)
             
+            # Hoist repeatedly used counts and lookups into locals
+            n_online = len(online_members)
+            # member_count is gateway-maintained; avoids walking the member cache
+            total_members = guild.member_count or len(guild.members)
+            online_percentage = (n_online / total_members) * 100
+            vibe_text = _get_vibe_text(online_percentage)
+            vibe_emoji = _get_vibe_emoji(online_percentage)
+
+            # Spectacular animated title and activity color via one table lookup
+            title, color = _TITLE_COLOR_TABLE[bisect_left(_COUNT_THRESHOLDS, n_online)]
+
             # Create stunning progress visualization
-            total_members = len(interaction.guild.members)
-            online_percentage = (len(online_members) / total_members) * 100
             progress_bars = int(online_percentage / 10)
-            progress_bar = "🟩" * progress_bars + "⬜" * (10 - progress_bars)
+            progress_bar = _PROGRESS_BARS[min(progress_bars, 10)]
             
             embed = discord.Embed(
                 title=title,
-                description=f"```ansi\n\u001b[1;36m▓▓▓ INSTANT SERVER SNAPSHOT ▓▓▓\u001b[0m\n```\n" +
-                           f"🎯 **{len(online_members)}** amazing people online right now!\n" +
-                           f"📊 Activity Meter: {progress_bar} **{online_percentage:.1f}%**\n\n" +
-                           f"💫 *{bot._get_activity_message(len(online_members))}*",
+                description=_BANNER_SNAPSHOT +
+                            f"🎯 **{n_online}** amazing people online right now!\n"
+                            f"📊 Activity Meter: {progress_bar} **{online_percentage:.1f}%**\n\n"
+                            f"💫 *{_get_activity_message(n_online)}*",
                 color=color,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             )
             
-            # Enhanced status info with spectacular animations
-            status_info = {
-                discord.Status.online: {
-                    "emoji": "🟢",
-                    "name": "🌟 Online & Ready",
-                    "description": "```diff\n+ Active and ready to engage!\n```",
-                    "animation": "⚡",
-                    "subtitle": "Perfect for chatting!"
-                },
-                discord.Status.idle: {
-                    "emoji": "🟡", 
-                    "name": "🌙 Away Mode",
-                    "description": "```yaml\n~ Might be multitasking or AFK\n```",
-                    "animation": "💤",
-                    "subtitle": "May respond slower"
-                },
-                discord.Status.dnd: {
-                    "emoji": "🔴",
-                    "name": "🚫 Focus Mode",
-                    "description": "```css\n/* Deep work or important tasks */\n```",
-                    "animation": "🔕",
-                    "subtitle": "Please be respectful"
-                }
-            }
-            
-            # Add spectacular status fields with enhanced visuals
-            for status, members in status_groups.items():
+            # Enhanced status info with spectacular animations (module-level constant)
+            status_info = _STATUS_INFO
+
+
+            # Add spectacular status fields in a fixed display order
+            nonempty_groups = sum(1 for st in _TRACKED_STATUSES if status_groups.get(st))
+            for status in _TRACKED_STATUSES:
+                members = status_groups.get(status)
                 if members:
                     status_data = status_info[status]
-                    
-                    # Create beautiful animated member list
-                    if len(members) <= 8:
-                        member_list = "\n".join([f"{status_data['animation']} **{member.display_name}**" for member in members])
-                    else:
-                        member_list = "\n".join([f"{status_data['animation']} **{member.display_name}**" for member in members[:8]])
+
+                    # Create beautiful animated member list (slice first, join a generator)
+                    anim = status_data['animation']
+                    shown = members[:8]
+                    member_list = "\n".join(f"{anim} **{m.display_name}**" for m in shown)
+                    if len(members) > 8:
                         member_list += f"\n🎭 *...and {len(members) - 8} more incredible people!*"
                     
                     embed.add_field(
                         name=f"{status_data['emoji']} {status_data['name']} ({len(members)})",
                         value=f"{status_data['description']}\n{member_list}\n\n*{status_data['subtitle']}*",
-                        inline=True if len([g for g in status_groups.values() if g]) > 1 else False
+                        inline=(nonempty_groups > 1)
                     )
             
             # Spectacular server analytics section
             embed.add_field(
                 name="📈🎯 Live Server Analytics",
-                value=f"```ini\n[Activity Level] = {online_percentage:.1f}%\n" +
-                      f"[Online Now]    = {len(online_members)} members\n" +
-                      f"[Total Members] = {total_members} people\n" +
-                      f"[Server Vibe]   = {bot._get_vibe_text(online_percentage)}\n```\n" +
-                      f"🎪 **Community Energy:** {bot._get_vibe_emoji(online_percentage)} {bot._get_vibe_text(online_percentage)}",
+                value=f"```ini\n[Activity Level] = {online_percentage:.1f}%\n"
+                      f"[Online Now]    = {n_online} members\n"
+                      f"[Total Members] = {total_members} people\n"
+                      f"[Server Vibe]   = {vibe_text}\n```\n"
+                      f"🎪 **Community Energy:** {vibe_emoji} {vibe_text}",
                 inline=False
             )
             
             # Add interactive engagement section
             embed.add_field(
                 name="🎮 Engagement Opportunities",
-                value=f"```md\n# {bot._get_engagement_suggestion(len(online_members))}\n```\n" +
-                      f"💡 *Perfect time to start conversations, share content, or collaborate!*",
+                value=f"```md\n# {_get_engagement_suggestion(n_online)}\n```\n"
+                      "💡 *Perfect time to start conversations, share content, or collaborate!*",
                 inline=False
             )
         
         embed.set_footer(
-            text=f"🎭 Requested by {interaction.user.display_name} • 🏰 {interaction.guild.name} • ⚡ Instant results",
-            icon_url=interaction.user.display_avatar.url
+            text=f"🎭 Requested by {user_name} • 🏰 {guild_name} • ⚡ Instant results",
+            icon_url=user_icon
         )
-        
+
         # Add server icon as thumbnail for active servers
-        if online_members and interaction.guild.icon:
-            embed.set_thumbnail(url=interaction.guild.icon.url)
+        # (empty path returned above, so members are guaranteed here)
+        if guild.icon:
+            embed.set_thumbnail(url=guild.icon.url)
         
         await interaction.followup.send(embed=embed)
         
     except Exception as e:
         logger.error(f"Error in online command: {e}")
-        error_embed = discord.Embed(
-            title="⚠️ Oops! Something went wrong",
-            description="```css\n/* Unable to fetch online members right now */\n```\n" +
-                       "🔧 *Please try again in a moment or contact an admin if this persists.*",
-            color=discord.Color.red(),
-            timestamp=datetime.now()
+        error_embed = _error_embed(
+            "```css\n/* Unable to fetch online members right now */\n```\n"
+            "🔧 *Please try again in a moment or contact an admin if this persists.*",
+            title="⚠️ Oops! Something went wrong"
         )
+        error_embed.timestamp = utcnow()
         await interaction.followup.send(embed=error_embed, ephemeral=True)
 
 @bot.tree.command(name="setchannel", description="Set the channel for automatic online member notifications")
@@ -807,7 +1003,7 @@ async def setchannel_command(interaction: discord.Interaction, channel: discord.
         
         # Set the notification channel
         bot.notification_channels[interaction.guild.id] = channel.id
-        bot.save_settings()
+        await bot.save_settings()
         
         embed = discord.Embed(
             title="✅ Notification Channel Set",
@@ -848,7 +1044,7 @@ async def removechannel_command(interaction: discord.Interaction):
         
         if interaction.guild.id in bot.notification_channels:
             del bot.notification_channels[interaction.guild.id]
-            bot.save_settings()
+            await bot.save_settings()
             
             embed = discord.Embed(
                 title="✅ Notifications Disabled",
@@ -874,18 +1070,15 @@ async def setrole_command(interaction: discord.Interaction, role: discord.Role):
         guild_id = interaction.guild.id
         
         # Check if user has permission to manage roles
-        if not interaction.user.guild_permissions.manage_roles:
-            embed = discord.Embed(
-                title="❌ Permission Denied",
-                description="You need the 'Manage Roles' permission to use this command.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if (denied := _require_admin(interaction)) is not None:
+            await interaction.response.send_message(embed=denied, ephemeral=True)
             return
         
         # Set the target role
         bot.target_roles[guild_id] = role.id
-        bot.save_settings()
+        bot.target_role_members[guild_id] = {m.id for m in role.members}
+        bot._target_role_cache[guild_id] = role
+        await bot.save_settings()
         
         embed = discord.Embed(
             title="✅ Target Role Set",
@@ -906,11 +1099,7 @@ async def setrole_command(interaction: discord.Interaction, role: discord.Role):
         
     except Exception as e:
         logger.error(f"Error in setrole command: {e}")
-        embed = discord.Embed(
-            title="❌ Error",
-            description="An error occurred while setting the target role.",
-            color=discord.Color.red()
-        )
+        embed = _error_embed("An error occurred while setting the target role.")
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 @bot.tree.command(name="removerole", description="Remove role-based filtering for notifications")
@@ -920,27 +1109,20 @@ async def removerole_command(interaction: discord.Interaction):
         guild_id = interaction.guild.id
         
         # Check if user has permission to manage roles
-        if not interaction.user.guild_permissions.manage_roles:
-            embed = discord.Embed(
-                title="❌ Permission Denied",
-                description="You need the 'Manage Roles' permission to use this command.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if (denied := _require_admin(interaction)) is not None:
+            await interaction.response.send_message(embed=denied, ephemeral=True)
             return
         
         if guild_id not in bot.target_roles:
-            embed = discord.Embed(
-                title="❌ No Role Set",
-                description="There's no target role set for this server.",
-                color=discord.Color.red()
-            )
+            embed = _not_found_embed("No Role Set", "There's no target role set for this server.")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         # Remove the target role
         del bot.target_roles[guild_id]
-        bot.save_settings()
+        bot.target_role_members.pop(guild_id, None)
+        bot._target_role_cache.pop(guild_id, None)
+        await bot.save_settings()
         
         embed = discord.Embed(
             title="✅ Role Filter Removed",
@@ -952,11 +1134,7 @@ async def removerole_command(interaction: discord.Interaction):
         
     except Exception as e:
         logger.error(f"Error in removerole command: {e}")
-        embed = discord.Embed(
-            title="❌ Error",
-            description="An error occurred while removing the target role.",
-            color=discord.Color.red()
-        )
+        embed = _error_embed("An error occurred while removing the target role.")
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 @bot.tree.command(name="checkrole", description="Check your current roles and target role status")
@@ -973,13 +1151,14 @@ async def checkrole_command(interaction: discord.Interaction):
         
         if target_role_id:
             target_role = interaction.guild.get_role(target_role_id)
-            has_target_role = target_role in member.roles
+            # Member.get_role is an indexed lookup; no linear scan of the role list
+            has_target_role = member.get_role(target_role_id) is not None
         
         # Create embed
         embed = discord.Embed(
             title="🔍 Role Check Results",
             color=0x00ff00 if has_target_role else 0xff9900,
-            timestamp=datetime.now()
+            timestamp=utcnow()
         )
         
         embed.add_field(
@@ -988,8 +1167,8 @@ async def checkrole_command(interaction: discord.Interaction):
             inline=False
         )
         
-        # Show all user roles
-        user_roles = [role.name for role in member.roles if role.name != "@everyone"]
+        # Show all user roles (@everyone is always member.roles[0], so skip it by index)
+        user_roles = [role.name for role in member.roles[1:]]
         embed.add_field(
             name="🎭 Your Roles",
             value=", ".join(user_roles) if user_roles else "No special roles",
@@ -1027,33 +1206,20 @@ async def testnotify_command(interaction: discord.Interaction):
     """Test the notification system"""
     try:
         # Check if user has permission to manage roles
-        if not interaction.user.guild_permissions.manage_roles:
-            embed = discord.Embed(
-                title="❌ Permission Denied",
-                description="You need the 'Manage Roles' permission to use this command.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        if (denied := _require_admin(interaction)) is not None:
+            await interaction.response.send_message(embed=denied, ephemeral=True)
             return
         
         guild_id = interaction.guild.id
         
         # Check configuration
         if guild_id not in bot.notification_channels:
-            embed = discord.Embed(
-                title="❌ No Channel Set",
-                description="Please set a notification channel first with `/setchannel`",
-                color=discord.Color.red()
-            )
+            embed = _not_found_embed("No Channel Set", "Please set a notification channel first with `/setchannel`")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         if guild_id not in bot.target_roles:
-            embed = discord.Embed(
-                title="❌ No Role Set", 
-                description="Please set a target role first with `/setrole`",
-                color=discord.Color.red()
-            )
+            embed = _not_found_embed("No Role Set", "Please set a target role first with `/setrole`")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
@@ -1062,34 +1228,26 @@ async def testnotify_command(interaction: discord.Interaction):
         target_role = interaction.guild.get_role(bot.target_roles[guild_id])
         
         if not channel:
-            embed = discord.Embed(
-                title="❌ Channel Not Found",
-                description="The notification channel could not be found.",
-                color=discord.Color.red()
-            )
+            embed = _not_found_embed("Channel Not Found", "The notification channel could not be found.")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         if not target_role:
-            embed = discord.Embed(
-                title="❌ Role Not Found",
-                description="The target role could not be found.",
-                color=discord.Color.red()
-            )
+            embed = _not_found_embed("Role Not Found", "The target role could not be found.")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         # Send test notification
         test_embed = discord.Embed(
             title="🧪✨ **NOTIFICATION SYSTEM TEST**",
-            description=f"```ansi\n\u001b[1;32m▓▓▓ SYSTEM STATUS: OPERATIONAL ▓▓▓\u001b[0m\n```\n" +
+            description=_BANNER_OPERATIONAL +
                        f"🎯 **Target Role:** {target_role.mention}\n" +
                        f"📢 **Notification Channel:** {channel.mention}\n" +
                        f"👥 **Members with role:** {len(target_role.members)}\n\n" +
                        f"✅ **The notification system is working correctly!**\n" +
                        f"🔔 Members with the {target_role.name} role will trigger notifications when they go online/offline.",
             color=discord.Color.green(),
-            timestamp=datetime.now()
+            timestamp=utcnow()
         )
 
         test_embed.set_footer(text="🏰 LIMITLESS • Test completed successfully")
@@ -1107,11 +1265,7 @@ async def testnotify_command(interaction: discord.Interaction):
         
     except Exception as e:
         logger.error(f"Error in testnotify command: {e}")
-        embed = discord.Embed(
-            title="❌ Error",
-            description="An error occurred while testing notifications.",
-            color=discord.Color.red()
-        )
+        embed = _error_embed("An error occurred while testing notifications.")
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 @bot.tree.command(name="testdm", description="Test the DM notification system - sends you a sample DM")
@@ -1120,27 +1274,32 @@ async def testdm_command(interaction: discord.Interaction):
     try:
         await interaction.response.defer(ephemeral=True)
         
+        # Hoist interaction property lookups used multiple times below
+        user = interaction.user
+        user_name = user.display_name
+        guild_name = interaction.guild.name
+
         # Create the same DM embed that would be sent for real notifications
         embed = discord.Embed(
             title="🟢 Someone's Online!",
-            description=f"**{interaction.user.display_name}** just came online in **{interaction.guild.name}**!",
+            description=f"**{user_name}** just came online in **{guild_name}**!",
             color=0x00ff00,
-            timestamp=datetime.now()
+            timestamp=utcnow()
         )
-        embed.set_thumbnail(url=interaction.user.display_avatar.url)
+        embed.set_thumbnail(url=user.display_avatar.url)
         embed.add_field(
             name="💬 Ready to Chat",
             value="Perfect timing to start a conversation!",
             inline=False
         )
         embed.set_footer(
-            text=f"From {interaction.guild.name} • This is a test DM",
+            text=f"From {guild_name} • This is a test DM",
             icon_url=interaction.guild.icon.url if interaction.guild.icon else None
         )
         
         # Try to send the DM
         try:
-            await interaction.user.send(embed=embed)
+            await user.send(embed=embed)
             
             # Confirm in the channel
             success_embed = discord.Embed(
@@ -1152,22 +1311,17 @@ async def testdm_command(interaction: discord.Interaction):
             await interaction.followup.send(embed=success_embed, ephemeral=True)
             
         except discord.Forbidden:
-            error_embed = discord.Embed(
-                title="❌ Cannot Send DM",
-                description="I couldn't send you a DM. Please check that:\n" +
-                           "• You have DMs enabled from server members\n" +
-                           "• You haven't blocked the bot",
-                color=discord.Color.red()
+            error_embed = _error_embed(
+                "I couldn't send you a DM. Please check that:\n"
+                "• You have DMs enabled from server members\n"
+                "• You haven't blocked the bot",
+                title="❌ Cannot Send DM"
             )
             await interaction.followup.send(embed=error_embed, ephemeral=True)
             
     except Exception as e:
         logger.error(f"Error in testdm command: {e}")
-        error_embed = discord.Embed(
-            title="❌ Error",
-            description="An error occurred while testing DM notifications.",
-            color=discord.Color.red()
-        )
+        error_embed = _error_embed("An error occurred while testing DM notifications.")
         await interaction.followup.send(embed=error_embed, ephemeral=True)
 
 @bot.event